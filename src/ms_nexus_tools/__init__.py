@@ -2,13 +2,42 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-from . import lib as lib
-from . import api as api
-from .cli.compound import compound
-from .cli.inspect_h5 import inspect
-from .cli.query import query, bulk_query
-from .cli.nx_data_stats import print_nx_data_stats
-from .cli.nexus_slice import nxslice
+from typing import Any
+from importlib import import_module
+
+# The subpackages and CLI entry points are resolved on first access so that
+# importing the package (as every console script does) only loads the modules
+# that invocation actually uses.
+_LAZY_ATTRS = {
+    "lib": ".lib",
+    "api": ".api",
+    "compound": ".cli.compound",
+    "inspect": ".cli.inspect_h5",
+    "query": ".cli.query",
+    "bulk_query": ".cli.query",
+    "print_nx_data_stats": ".cli.nx_data_stats",
+    "nxslice": ".cli.nexus_slice",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_ATTRS:
+        module = import_module(_LAZY_ATTRS[name], __name__)
+        value = module if name in ("lib", "api") else getattr(module, name)
+        globals()[name] = value
+        return value
+    # Any real subpackage (e.g. cli) resolves too, so attribute access does
+    # not depend on the import side effects the eager __init__ used to have.
+    try:
+        return import_module(f".{name}", __name__)
+    except ModuleNotFoundError as err:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}",
+        ) from err
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_ATTRS})
 
 
 def main() -> None:
@@ -2,10 +2,32 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-from . import image_args
-from . import image_plot
-from . import spectrum_plot
-from . import image_and_spectrum_plot
-from . import formula_args
-from . import mass_range_args
-from . import imzml
+from typing import Any
+from importlib import import_module
+
+# Imported lazily: the plotting modules pull in matplotlib, which is a large
+# cost for callers that only want the data processing side.
+_SUBMODULES = (
+    "image_args",
+    "image_plot",
+    "spectrum_plot",
+    "image_and_spectrum_plot",
+    "formula_args",
+    "mass_range_args",
+    "imzml",
+)
+
+
+def __getattr__(name: str) -> Any:
+    # Any real submodule resolves, not just the ones __dir__ advertises, so
+    # access does not depend on what another module happened to import first.
+    try:
+        return import_module(f".{name}", __name__)
+    except ModuleNotFoundError as err:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}",
+        ) from err
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_SUBMODULES})
@@ -8,6 +8,19 @@ from dataclasses import dataclass
 from argsui import arg_field, ArgType
 from ..lib import elements
 
+_FORMULA_TOKEN = re.compile(r"([A-Z][a-z]*)(\d*)?")
+
+# Per-element (average, lightest, most abundant) masses, computed once so that
+# repeated formula parses are three multiply-adds per token.
+_ELEMENT_MASSES: dict[str, tuple[float, float, float]] = {
+    symbol: (
+        sum(iso.accurate * iso.abundance for iso in element.isotopes) / 100,
+        element.isotopes[0].accurate,
+        max(element.isotopes, key=lambda iso: iso.abundance).accurate,
+    )
+    for symbol, element in elements.elements.items()
+}
+
 
 @dataclass
 class ProcessArgs:
@@ -29,15 +42,12 @@ def process(args: ProcessArgs) -> CompoundProperties:
 
     properties = CompoundProperties(args.compound)
 
-    for val in re.finditer(r"([A-Z][a-z]*)(\d*)?", properties.formula):
+    for val in _FORMULA_TOKEN.finditer(properties.formula):
         element, count = val.groups()
         count = int(count) if count is not None and len(count) > 0 else 1
-        isotopes = elements.elements[element].isotopes
-        properties.average_mass += (
-            count * sum([iso.accurate * iso.abundance for iso in isotopes]) / 100
-        )
-        abundant = max(isotopes, key=lambda x: x.abundance)
-        properties.lightest_monoisotropic_mass += count * isotopes[0].accurate
-        properties.abundant_monoisotropic_mass += count * abundant.accurate
+        average, lightest, abundant = _ELEMENT_MASSES[element]
+        properties.average_mass += count * average
+        properties.lightest_monoisotropic_mass += count * lightest
+        properties.abundant_monoisotropic_mass += count * abundant
 
     return properties
@@ -2,14 +2,14 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 from typing import Any, Iterable, Generator
-from threading import Lock, local
+from threading import Lock
 import concurrent.futures as cfutures
 from dataclasses import dataclass, field
 from pathlib import Path
 import numpy as np
 import numpy.typing as npt
 import sparse
-from h5py import h5s
+from h5py import Dataset, h5s
 
 from tqdm import tqdm
 
@@ -253,6 +253,10 @@ def choose_memory_buffer_and_data_chunks(
             min_chunk_count=memory_chunks.chunk_count,
         )
         chunker.normalise()
+        # Each memory chunk is written as one hyperslab, so snap the dataset
+        # chunks to divide it and avoid the decompress-modify-recompress path
+        # for partially covered chunks.
+        chunker.align_to(memory_chunks.chunk_shape)
         data_chunks[name] = (
             chunker,
             dtype,
@@ -392,18 +396,17 @@ class Accumulation:
 
         sub_data = data[*chunk] if isinstance(data, sparse.COO) else data
 
-        max_data = np.maximum(self.max_data[*sub_chunk], sub_data.max(axis=self.axis))
-        sum_data = np.add(self.sum_data[*sub_chunk], sub_data.sum(axis=self.axis))
-
+        max_data = sub_data.max(axis=self.axis)
+        sum_data = sub_data.sum(axis=self.axis)
         if isinstance(max_data, sparse.COO):
-            self.max_data[*sub_chunk] = max_data.todense()
-        else:
-            self.max_data[*sub_chunk] = max_data
-
+            max_data = max_data.todense()
         if isinstance(sum_data, sparse.COO):
-            self.sum_data[*sub_chunk] = sum_data.todense()
-        else:
-            self.sum_data[*sub_chunk] = sum_data
+            sum_data = sum_data.todense()
+
+        # The kernel is a NumPy reduction already, so accumulate straight into
+        # the slab views rather than building a combined temporary per chunk.
+        np.maximum(self.max_data[*sub_chunk], max_data, out=self.max_data[*sub_chunk])
+        np.add(self.sum_data[*sub_chunk], sum_data, out=self.sum_data[*sub_chunk])
 
         self.has_data = True
 
@@ -540,9 +543,16 @@ def write_data(
                 "Recived a binned axis, with dense data. The data should be sparse. ",
             )
 
+        chunk_data = np.ascontiguousarray(chunk_data)
         for data_entry in data_chunks.names:
             assert data_entry != _count_subentry_name()
-            nxs.root[data_entry].data.signal[*memory_chunk] = chunk_data
+            signal = nxs.root[data_entry].data.signal
+            # write_direct skips the NXfield assignment path and its
+            # intermediate copy of the slab.
+            Dataset(signal.id).write_direct(
+                chunk_data,
+                dest_sel=tuple(memory_chunk),
+            )
         return chunk_data, None
 
     if chunk_data.coords.shape[1] == 0:
@@ -588,6 +598,12 @@ def write_data(
 
     axis_names = [axis.name for axis in binned_axes]
     axis_used = dict.fromkeys(axis_names, False)
+
+    # The same element selection and memory space are used for every dataset,
+    # so build them once rather than per write.
+    element_coords = np.ascontiguousarray(chunk_data.coords.T)
+    m_space = h5s.create_simple(counts.shape)
+
     for data_entry, _, _ in tqdm(data_chunk_values, desc="Processing data chunks"):
         for name in chunk_data.values:
             if name != "signal" and name not in axis_names:
@@ -602,8 +618,7 @@ def write_data(
                 axis_used[name] = True
 
             f_space = ds.id.get_space()
-            f_space.select_elements(chunk_data.coords.T, h5s.SELECT_SET)
-            m_space = h5s.create_simple(chunk_data[name].shape)
+            f_space.select_elements(element_coords, h5s.SELECT_SET)
 
             if data_entry == _count_subentry_name():
                 ds.id.write(m_space, f_space, counts)
@@ -611,7 +626,8 @@ def write_data(
                 ds.id.write(m_space, f_space, chunk_data[name])
 
             f_space.close()
-            m_space.close()
+
+    m_space.close()
 
     for k, v in axis_used.items():
         if not v:
@@ -735,32 +751,31 @@ def process(args: ProcessArgs, config: dict[str, Any] = {}) -> None:
             nexus_file_lock = Lock()
 
             def process_chunk(memory_chunk: Chunk) -> None:
-                local_store = local()
                 with data_source_lock:
-                    local_store.chunk_data = args.data_source.fill_chunk(
+                    chunk_data = args.data_source.fill_chunk(
                         memory_chunk,
                         overall_reads_timer.update,
                     )
 
                 with nexus_file_lock:
-                    local_store.written_signal, local_store.written_count = write_data(
+                    written_signal, written_count = write_data(
                         nxs,
                         args,
                         memory_chunk,
                         full_shape,
                         binned_axis,
-                        local_store.chunk_data,
+                        chunk_data,
                         data_chunks,
                     )
-                    del local_store.chunk_data
+                    del chunk_data
 
                 with accumulation_lock:
                     accumulate_data(
                         accumulations,
                         count_accumulations,
                         memory_chunk,
-                        local_store.written_signal,
-                        local_store.written_count,
+                        written_signal,
+                        written_count,
                     )
 
             outer_chunks = list(memory_chunks.chunks())
@@ -788,6 +803,7 @@ def process(args: ProcessArgs, config: dict[str, Any] = {}) -> None:
             desc="Writing accumulations",
         ):
             if accumulation.has_data:
-                extra_slices = [slice(None) for _ in range(accumulation.ndim)]
-                nxs.root[name].data.signal[0, *extra_slices] = accumulation.max_data
-                nxs.root[name].data.signal[1, *extra_slices] = accumulation.sum_data
+                signal = nxs.root[name].data.signal
+                Dataset(signal.id).write_direct(
+                    np.stack([accumulation.max_data, accumulation.sum_data]),
+                )
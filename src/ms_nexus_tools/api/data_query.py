@@ -206,13 +206,14 @@ def process(args: ProcessArgs, config: dict[str, Any] = {}) -> None:
         ]
 
         layer_digits = count_digits(data_shape[0])
+        title = f"{args.in_path.stem}"
         for ll in range(layer_slice.start, layer_slice.stop):
             for image in mass_images:
                 image.clear()
 
             nx.fill_filters(ll, bins, xy, mass_images, inner_chunk)
 
-            title = f"{args.in_path.stem}"
+            layer_prefix = f"{title}.layer_{ll + 1:0{layer_digits}}"
 
             plot_mass_ranges(
                 mass_values,
@@ -224,7 +225,7 @@ def process(args: ProcessArgs, config: dict[str, Any] = {}) -> None:
                 args.interpolation_order,
                 args.origin,
                 args.out_dir,
-                f"{title}.layer_{ll + 1:0{layer_digits}}",
+                layer_prefix,
                 args.write_txt,
                 isp_config,
             )
@@ -239,7 +240,7 @@ def process(args: ProcessArgs, config: dict[str, Any] = {}) -> None:
                         args.interpolation_order,
                         args.origin,
                         args.out_dir,
-                        f"{title}.layer_{ll + 1:0{layer_digits}}",
+                        layer_prefix,
                         args.write_txt,
                         tic_config,
                     )
@@ -269,7 +270,9 @@ def process(args: ProcessArgs, config: dict[str, Any] = {}) -> None:
                         cval=0.0,
                     )
 
-                filename = f"{title}.layer_{ll + 1:0{layer_digits}}.{args.accumulator.value}_{args.scaling.value}"
+                filename = (
+                    f"{layer_prefix}.{args.accumulator.value}_{args.scaling.value}"
+                )
                 norm_title = (
                     f"Layer: {ll + 1} ({args.accumulator.value}/{args.scaling.value})"
                 )
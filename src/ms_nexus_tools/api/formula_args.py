@@ -6,11 +6,11 @@ import copy
 from pathlib import Path
 from typing import NamedTuple
 from dataclasses import dataclass
-from bisect import bisect_left, bisect_right
 
 import numpy as np
 
 from argsui import arg_field
+from ..lib.utils import index_from_value
 from . import compound as nxcomp
 
 from ..lib.bounds import Shape
@@ -41,8 +41,8 @@ class FormulaAndRange(NamedTuple):
     ) -> "FormulaAndRange":
         mass = nxcomp.process(nxcomp.ProcessArgs(formula)).lightest_monoisotropic_mass
         half_width = width / 2
-        start_mass_index = bisect_left(mass_axis, mass - half_width)
-        stop_mass_index = bisect_right(mass_axis, mass + half_width)
+        start_mass_index = index_from_value(mass_axis, mass - half_width, side="left")
+        stop_mass_index = index_from_value(mass_axis, mass + half_width, side="right")
 
         return FormulaAndRange(
             formula=formula,
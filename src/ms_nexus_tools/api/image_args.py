@@ -4,13 +4,14 @@
 
 from collections.abc import Sequence
 from dataclasses import dataclass
-import bisect
 from enum import Enum
 
 import numpy as np
 
 from argsui import arg_field
 
+from ..lib.utils import index_from_value
+
 
 def _cycle(cycle: int | None, length: int) -> int:
     if cycle is None:
@@ -135,8 +136,8 @@ class MassSliceArgs:
         match self.use_mass:
             case MassMeasure.MASS:
                 return _slice(
-                    bisect.bisect_left(mass_axis, self.start_mass),
-                    bisect.bisect_right(mass_axis, self.end_mass)
+                    index_from_value(mass_axis, self.start_mass, side="left"),
+                    index_from_value(mass_axis, self.end_mass, side="right")
                     if self.end_mass is not None
                     else None,
                     len(mass_axis),
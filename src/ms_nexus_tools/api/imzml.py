@@ -12,6 +12,7 @@ from pyimzml.compression import NoCompression
 
 from tqdm import tqdm
 import numpy as np
+from h5py import Dataset
 
 from argsui import arg_field, FilePathType, ConfigFileArgs, InteractiveArgs, ArgType
 
@@ -141,42 +142,56 @@ def process(args: ProcessArgs, config: dict[str, Any] = {}) -> None:
             intensity_compression=NoCompression(),
             spec_type="profile",
         ) as writer:
-            xyz = [
-                (x, y, z)
-                for x, y, z in itertools.product(
-                    range(shape[args.x_axis]),
+            signal_data = Dataset(nx.root.entry[args.entry_name].data[args.signal].id)
+            mass_data = Dataset(nx.root.entry[args.entry_name].data[args.mass].id)
+
+            # One buffer per source, reused for every slab. read_direct
+            # converts to float32 during the read rather than allocating the
+            # stored dtype first and converting in a second pass.
+            slab_shape = tuple(s for ii, s in enumerate(shape) if ii != args.x_axis)
+            intensity_slab = np.empty(slab_shape, dtype=np.float32)
+            if mz is None:
+                mass_slab = np.empty(slab_shape, dtype=np.float32)
+
+            yz = [
+                (y, z)
+                for y, z in itertools.product(
                     range(shape[args.y_axis]) if args.y_axis >= 0 else [0],
                     range(shape[args.z_axis]) if args.z_axis >= 0 else [0],
                 )
             ]
-            for coords in tqdm(xyz, desc="Writing imzML"):
-                fill = 1 if args.one_indexed else 0
-                result_inx: list[int | slice] = [fill] * required_ndim
-                result_inx[args.x_axis] = coords[0]
-                result_inx[args.mz_axis] = slice(None)
-                if args.y_axis >= 0:
-                    result_inx[args.y_axis] = coords[1]
-                if args.z_axis >= 0:
-                    result_inx[args.z_axis] = coords[2]
-
-                intensity = (
-                    nx.root.entry[args.entry_name]
-                    .data[args.signal][*result_inx]
-                    .astype(np.float32)
-                )
-                if mz is None:
-                    masses = (
-                        nx.root.entry[args.entry_name]
-                        .data[args.mass][*result_inx]
-                        .astype(np.float32)
-                    )
-                else:
-                    masses = mz
-
-                if args.one_indexed:
-                    coords = tuple(cc + 1 for cc in coords)
-                writer.addSpectrum(
-                    masses,
-                    intensity,
-                    coords,
-                )
+
+            def slab_axis(axis: int) -> int:
+                # The slab drops the x dimension, shifting the later axes down.
+                return axis - 1 if axis > args.x_axis else axis
+
+            with tqdm(total=shape[args.x_axis] * len(yz), desc="Writing imzML") as bar:
+                for xx in range(shape[args.x_axis]):
+                    slab_inx: list[int | slice] = [slice(None)] * required_ndim
+                    slab_inx[args.x_axis] = xx
+
+                    signal_data.read_direct(intensity_slab, source_sel=tuple(slab_inx))
+                    if mz is None:
+                        mass_data.read_direct(mass_slab, source_sel=tuple(slab_inx))
+
+                    for yy, zz in yz:
+                        inner_inx: list[int | slice] = [slice(None)] * (
+                            required_ndim - 1
+                        )
+                        if args.y_axis >= 0:
+                            inner_inx[slab_axis(args.y_axis)] = yy
+                        if args.z_axis >= 0:
+                            inner_inx[slab_axis(args.z_axis)] = zz
+
+                        intensity = intensity_slab[*inner_inx]
+                        masses = mz if mz is not None else mass_slab[*inner_inx]
+
+                        coords = (xx, yy, zz)
+                        if args.one_indexed:
+                            coords = tuple(cc + 1 for cc in coords)
+                        writer.addSpectrum(
+                            masses,
+                            intensity,
+                            coords,
+                        )
+                        bar.update()
@@ -2,7 +2,6 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
 from pathlib import Path
 from typing import NamedTuple
@@ -13,6 +12,7 @@ import scipy
 
 from ..lib.bounds import Shape
 from ..lib.image import OriginLocation, adjust_origin
+from ..lib.utils import index_from_value
 from ..lib.mz_filter import MassRangeTotalImage, Accumulator
 from ..lib.normalisation import norm, Norm
 from . import compound as nxcomp
@@ -50,8 +50,8 @@ class MassRange(NamedTuple):
         stop_mass: float,
         mass_axis: np.ndarray,
     ) -> "MassRange":
-        start_mass_index = bisect_left(mass_axis, start_mass)
-        stop_mass_index = bisect_right(mass_axis, stop_mass)
+        start_mass_index = index_from_value(mass_axis, start_mass, side="left")
+        stop_mass_index = index_from_value(mass_axis, stop_mass, side="right")
 
         return MassRange(
             start_mass_index=start_mass_index,
@@ -76,8 +76,8 @@ class MassRange(NamedTuple):
             ).lightest_monoisotropic_mass
 
         half_width = width / 2
-        start_mass_index = bisect_left(mass_axis, mass - half_width)
-        stop_mass_index = bisect_right(mass_axis, mass + half_width)
+        start_mass_index = index_from_value(mass_axis, mass - half_width, side="left")
+        stop_mass_index = index_from_value(mass_axis, mass + half_width, side="right")
 
         return MassRange(
             start_mass_index=start_mass_index,
@@ -1,7 +1,6 @@
 # SPDX-FileCopyrightText: 2026 Duncan McDougall <duncan.mcdougall@rfi.ac.uk>
 #
 # SPDX-License-Identifier: Apache-2.0
-import bisect
 import copy
 from enum import Enum
 from typing import Any
@@ -27,12 +26,20 @@ from argsui import (
     FilePathType,
 )
 
-from ..lib.nxs import NexusFile, NxAxis, NxAxes, create_field, FieldOptions
+from ..lib.nxs import (
+    NexusFile,
+    NxAxis,
+    NxAxes,
+    create_field,
+    FieldOptions,
+    CHUNK_CACHE_BYTES,
+    CHUNK_CACHE_SLOTS,
+)
 from ..lib.chunker import count_chunks_to_cover
 from ..lib.bounds import Shape, Chunk
 from ..lib.image import plot_image
 from ..lib.spectrum import plot_spectrum
-from ..lib.utils import simplify_chunks
+from ..lib.utils import index_from_value, simplify_chunks
 
 from icecream import install as icecream_install
 
@@ -391,18 +398,18 @@ class GroupParams:
                 case SliceType.Centred:
                     start_value = axis.slice_var1 - axis.slice_var2 / 2
                     stop_value = axis.slice_var1 + axis.slice_var2 / 2
-                    start = bisect.bisect_left(values, start_value)
-                    stop = bisect.bisect_left(values, stop_value)
+                    start = index_from_value(values, start_value)
+                    stop = index_from_value(values, stop_value)
                     slc = slice(start, stop)
                 case SliceType.Range:
                     start_value = axis.slice_var1
                     stop_value = axis.slice_var2
-                    start = bisect.bisect_left(values, start_value)
-                    stop = bisect.bisect_left(values, stop_value)
+                    start = index_from_value(values, start_value)
+                    stop = index_from_value(values, stop_value)
                     slc = slice(start, stop)
                 case SliceType.Value:
                     start_value = axis.slice_var1
-                    start = bisect.bisect_left(values, start_value)
+                    start = index_from_value(values, start_value)
                     if start == len(values):
                         raise IndexError(
                             f"The value {start_value} is out of bounds of {axis_name}."
@@ -590,7 +597,14 @@ def process(args: ProcessArgs, config: dict[str, Any]) -> None:
     default_params = parse_default_args(args)
     all_params = parse_group_args(args)
 
-    with h5py.File(args.in_path, "r") as fle:
+    # The dask tasks all read through this handle, so give it the same chunk
+    # cache sizing that NexusFile uses rather than the 1Mb h5py default.
+    with h5py.File(
+        args.in_path,
+        "r",
+        rdcc_nbytes=CHUNK_CACHE_BYTES,
+        rdcc_nslots=CHUNK_CACHE_SLOTS,
+    ) as fle:
         for group, params in all_params.items():
             params.apply_default(default_params, fle)
             params.validate(group)
@@ -70,8 +70,10 @@ if __name__ == "__main__":
                     [Isotope(nominal, accurate, abundance)],
                 )
 
-    with open(args.output, "w") as out_file:
-        out_file.write("""
+    # Build the whole module in memory and write it in one call rather than
+    # one buffered write per element.
+    parts = [
+        """
 from typing import NamedTuple
 
 class Isotope(NamedTuple):
@@ -85,7 +87,12 @@ class Element(NamedTuple):
     isotopes: list[Isotope]
 
 elements = {
-""")
-        for key, element in data.items():
-            out_file.write(f'    "{key}": {element_to_str(element)},\n')
-        out_file.write("}\n")
+""",
+    ]
+    parts.extend(
+        f'    "{key}": {element_to_str(element)},\n' for key, element in data.items()
+    )
+    parts.append("}\n")
+
+    with open(args.output, "w") as out_file:
+        out_file.write("".join(parts))
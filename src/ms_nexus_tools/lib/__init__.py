@@ -2,15 +2,54 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-from . import bounds as bounds
-from . import chunker as chunker
-from . import mz_filter as mz_filter
-from . import image as image
-from . import nxs as nxs
-from . import utils as utils
-from .contained_bounds import ContainedBounds
-from .filetypes import DataType
-from .h5_printer import print_group
-from .image import OriginLocation
-from .normalisation import Accumulator, IncrementalAccumulator, Norm
-from .timers import JSONTimer, Timer, time_this
+from typing import Any
+from importlib import import_module
+
+# Submodules and re-exported names are resolved on first access so that
+# lightweight users (e.g. the compound CLI) do not load matplotlib and
+# nexusformat through this package.
+_SUBMODULES = (
+    "bounds",
+    "chunker",
+    "contained_bounds",
+    "filetypes",
+    "h5_printer",
+    "mz_filter",
+    "image",
+    "normalisation",
+    "nxs",
+    "timers",
+    "utils",
+)
+
+_EXPORTED_NAMES = {
+    "ContainedBounds": ".contained_bounds",
+    "DataType": ".filetypes",
+    "print_group": ".h5_printer",
+    "OriginLocation": ".image",
+    "Accumulator": ".normalisation",
+    "IncrementalAccumulator": ".normalisation",
+    "Norm": ".normalisation",
+    "JSONTimer": ".timers",
+    "Timer": ".timers",
+    "time_this": ".timers",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _EXPORTED_NAMES:
+        value = getattr(import_module(_EXPORTED_NAMES[name], __name__), name)
+        globals()[name] = value
+        return value
+    # Any real submodule resolves, not just the ones __dir__ advertises, so
+    # access does not depend on what another module happened to import first.
+    try:
+        return import_module(f".{name}", __name__)
+    except ModuleNotFoundError as err:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}",
+        ) from err
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_SUBMODULES, *_EXPORTED_NAMES})
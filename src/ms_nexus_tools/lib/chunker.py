@@ -377,6 +377,46 @@ class Chunker:
             for ds, cs in zip(self.data_shape, self.chunk_count, strict=True)
         )
 
+    def align_to(self, outer_chunk_shape: Shape) -> None:
+        """
+        Shrinks the chunk shape so that each axis exactly divides the matching
+        axis of outer_chunk_shape.
+        Writes issued one outer chunk at a time then cover whole chunks of
+        this chunker, so HDF5 never has to read back and re-compress a
+        partially covered chunk.
+
+        >>> chunker = Chunker.from_chunk_shape((100, 100), (7, 25))
+        >>> chunker.align_to((20, 50))
+        >>> chunker.chunk_shape
+        (5, 25)
+
+        A prime or divisor-poor outer extent has no usable divisors, so the
+        axis keeps its unaligned size rather than collapsing towards 1:
+        >>> chunker = Chunker.from_chunk_shape((100, 97), (10, 50))
+        >>> chunker.align_to((20, 97))
+        >>> chunker.chunk_shape
+        (10, 50)
+        """
+        aligned = []
+        for cs, outer in zip(self.chunk_shape, outer_chunk_shape, strict=True):
+            original = cs
+            while outer % cs != 0:
+                cs -= 1
+            # Tiny storage chunks cost more than the occasional re-compressed
+            # partial chunk, so only accept the divisor if it keeps at least
+            # half the requested extent.
+            if cs * 2 < original:
+                cs = original
+            aligned.append(cs)
+
+        self.chunk_shape = tuple(aligned)
+        self.chunk_count = tuple(
+            math.ceil(ds / cs)
+            for ds, cs in zip(self.data_shape, self.chunk_shape, strict=True)
+        )
+        self.n_chunks = int(np.prod(self.chunk_count))
+        self.chunk_items = int(np.prod(self.chunk_shape))
+
     def _chunk(self, dimension: int, count: int) -> slice:
         assert count * self.chunk_shape[dimension] < self.data_shape[dimension]
         return slice(
@@ -392,18 +432,17 @@ class Chunker:
     def chunks(self) -> Generator[Chunk]:
         """
         A generator that yeilds all the chunks covered by this chunker.
+        The last axis varies fastest, so consecutive chunks are adjacent in
+        storage order.
         """
-        indices = np.zeros((self.n_dims,))
-        for _chunk_inx in range(self.n_chunks):
-            for ii in range(self.n_dims):
-                indices[ii] += 1
-                if indices[ii] >= self.chunk_count[ii]:
-                    indices[ii] = 0
-                    continue
-                else:
-                    break
-            yield Chunk([self._chunk(ii, indices[ii]) for ii in range(self.n_dims)])
-        return
+        # Each axis only has chunk_count[ii] distinct slices, so build them
+        # once instead of recomputing per chunk.
+        dim_chunks = [
+            [self._chunk(ii, cc) for cc in range(self.chunk_count[ii])]
+            for ii in range(self.n_dims)
+        ]
+        for slices in itertools.product(*dim_chunks):
+            yield Chunk(slices)
 
     def bulk_chunks(self) -> list[Chunk]:
         """
@@ -20,21 +20,14 @@ def print_group(d, offset="", max_depth=-1) -> None:
     if "keys" not in dir(d):
         print_item(d, offset)
         return
-    mx = len(d.keys())
-    if mx < 10:
-        for k in d:
-            print_item(d[k], offset)
-            print_group(d[k], offset=offset + "- ", max_depth=max_depth - 1)
-
-    else:
-        for ii in range(5):
-            k = d.keys()[ii]
-
-            print_item(d[k], offset)
-            print_group(d[k], offset=offset + "- ", max_depth=max_depth - 1)
-        print(" " * len(offset) + "...")
-        for ii in range(-5, 0):
-            k = d.keys()[ii]
-
-            print_item(d[k], offset)
-            print_group(d[k], offset=offset + "- ", max_depth=max_depth - 1)
+    # Snapshot the children once: each d[k] lookup walks the h5py/nexusformat
+    # object layer, and KeysView does not support indexing anyway.
+    items = list(d.items())
+    shown = [items] if len(items) < 10 else [items[:5], items[-5:]]
+
+    for block in shown:
+        for _, item in block:
+            print_item(item, offset)
+            print_group(item, offset=offset + "- ", max_depth=max_depth - 1)
+        if len(shown) > 1 and block is not shown[-1]:
+            print(" " * len(offset) + "...")
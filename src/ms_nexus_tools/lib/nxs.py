@@ -2,6 +2,7 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 import h5py
+import hdf5plugin
 
 from typing import Any, NamedTuple
 from dataclasses import dataclass
@@ -112,12 +113,43 @@ class FieldOptions(NamedTuple):
     shuffle: bool
 
 
+# The h5py default chunk cache (1Mb) is smaller than a single chunk of the
+# datasets this package writes, so partial-chunk access would bypass the cache
+# entirely.  Size the cache for a few dozen chunks and use a prime slot count
+# well above the number of cached chunks to keep hash collisions rare.
+CHUNK_CACHE_BYTES = 256 * 1024 * 1024
+CHUNK_CACHE_SLOTS = 100_003
+
+# Shared default codec; Blosc instances are immutable filter descriptions, so
+# one module-level object serves every default argument.
+DEFAULT_COMPRESSION = hdf5plugin.Blosc()
+
+
 class NexusFile:
-    def __init__(self, filename: Path, mode: str = "r", locking=None):
+    def __init__(
+        self,
+        filename: Path,
+        mode: str = "r",
+        locking=None,
+        rdcc_nbytes: int = CHUNK_CACHE_BYTES,
+        rdcc_nslots: int = CHUNK_CACHE_SLOTS,
+    ):
         self.filename = filename
 
+        if locking is None and mode == "r":
+            # Read-only consumers gain nothing from the fcntl lock round
+            # trip, which adds per-open latency and spurious BlockingIOErrors
+            # on network filesystems.
+            locking = False
+
         self._mode = mode
-        self._file = nxload(filename, mode, locking=locking)
+        self._file = nxload(
+            filename,
+            mode,
+            locking=locking,
+            rdcc_nbytes=rdcc_nbytes,
+            rdcc_nslots=rdcc_nslots,
+        )
 
         if mode == "w" or mode == "w-" or mode == "x":
             self._file["entry"] = NXentry()
@@ -274,21 +306,22 @@ def write_from_data(
     y_microns: float,
     mass: np.ndarray,
     mass_unit: str = "mz",
-    compression: str = "gzip",
-    compression_level: int = 4,
+    compression: Any = DEFAULT_COMPRESSION,
+    compression_level: int | None = None,
+    dtype: npt.DTypeLike | None = None,
 ) -> NexusFile:
     axes = NxAxes(
         [
             [
                 NxAxis.create(
-                    values=np.arange(1, data.shape[0] + 1, 1.0),
+                    values=np.arange(1, data.shape[0] + 1, dtype=np.float64),
                     name="layer",
                     indices=[1],
                 ),
             ],
             [
                 NxAxis.create(
-                    values=np.arange(0, data.shape[1], 1.0) * x_microns,
+                    values=np.arange(data.shape[1], dtype=np.float64) * x_microns,
                     name="x",
                     unit="micron",
                     indices=[2],
@@ -296,7 +329,7 @@ def write_from_data(
             ],
             [
                 NxAxis.create(
-                    values=np.arange(0, data.shape[2], 1.0) * y_microns,
+                    values=np.arange(data.shape[2], dtype=np.float64) * y_microns,
                     name="y",
                     unit="micron",
                     indices=[2],
@@ -317,16 +350,43 @@ def write_from_data(
         spectrum=data.shape[3],
     )
 
+    if dtype is None:
+        # Spectrum counts rarely need 32 bits; storing int16 when the values
+        # fit halves the bytes pushed through the compression pipeline.
+        fits_int16 = np.can_cast(data.dtype, np.int16) or (
+            int(data.min()) >= np.iinfo(np.int16).min
+            and int(data.max()) <= np.iinfo(np.int16).max
+        )
+        dtype = np.int16 if fits_int16 else np.int32
+
+    chunker = Chunker.from_max_item_count(
+        data_shape=tuple(data.shape),
+        priorities=(3, 2, 2, 1),
+        items_per_chunk=int(1024 * 1024 * 8 / np.dtype(dtype).itemsize),
+    )
+    chunker.normalise()
+
     nxs.set_data(
         create_field(
-            dtype="int32",
+            dtype=dtype,
             shape=data.shape,
             compression=compression,
             compression_opts=compression_level,
+            chunks=chunker.chunk_shape,
         ),
         axes=axes,
     )
-    nxs.root.data.signal[:] = data[:]
+
+    # Stream the array one storage chunk at a time rather than pushing the
+    # whole thing through a single assignment: every write covers complete
+    # chunks, so nothing is read back for re-compression.
+    with nxs.as_context():
+        signal = h5py.Dataset(nxs.root.data.signal.id)
+        for chunk in chunker.chunks():
+            signal.write_direct(
+                np.ascontiguousarray(data[tuple(chunk)]),
+                dest_sel=tuple(chunk),
+            )
 
     return nxs
 
@@ -337,10 +397,10 @@ def create_standard_file(
     out_path: Path,
     axes: NxAxes | None = None,
     field_options=FieldOptions(  # noqa: B008
-        compression="gzip",
-        compression_opts=4,
+        compression=DEFAULT_COMPRESSION,
+        compression_opts=None,
         max_bytes_per_chunk=1024 * 1024 * 8,
-        shuffle=False,
+        shuffle=True,
     ),
 ) -> tuple[NexusFile, ContainedBounds, tuple[Chunker, ...]]:
     cbounds = ContainedBounds.from_chunk(outer_shape=data_shape, inner_chunk=out_chunk)
@@ -3,9 +3,11 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from typing import Any
+from contextlib import ExitStack
 from pathlib import Path
 
 import numpy as np
+from h5py import Dataset
 
 from tqdm import tqdm
 
@@ -14,6 +16,7 @@ from .nxs import NexusFile
 from .query_source import AbstractQuerySource
 from .mz_filter import MzFilter, Accumulator
 from .chunker import count_chunks_to_cover
+from .utils import slice_len
 
 
 class NxsQuerySource(AbstractQuerySource):
@@ -24,12 +27,28 @@ class NxsQuerySource(AbstractQuerySource):
         self._shape = self.nx_file.root.spectra.data.signal.shape
         self._mass_values = self.nx_file.root.spectra.data.mass.nxdata
 
+        # Raw h5py handles: every nexusformat access walks the NX tree, which
+        # is pure Python overhead on the read path.  The file context is held
+        # open for the lifetime of the source so the handles stay valid;
+        # nexusformat would otherwise close the file between accesses.
+        self._file_context = ExitStack()
+        self._file_context.enter_context(self.nx_file.as_context())
+        self._spectra_signal = Dataset(self.nx_file.root.spectra.data.signal.id)
+        self._images_signal = Dataset(self.nx_file.root.images.data.signal.id)
+
+        self._spectra_chunking = self._spectra_signal.chunks
+        self._images_chunking = self._images_signal.chunks
+        self._spectra_chunk_count = np.prod(
+            count_chunks_to_cover(self._shape, self._spectra_chunking),
+        )
+
         self._tqdm = tqdm
 
     def __enter__(self) -> "NxsQuerySource":
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
+        self._file_context.close()
         self.nx_file.close()
 
     def shape(self) -> Shape:
@@ -52,36 +71,47 @@ class NxsQuerySource(AbstractQuerySource):
         totals: list[MzFilter],
         chunk: Chunk,
     ) -> None:
-        spectra_chunking = self.nx_file.root.spectra.data.signal.chunks
-        self._spectra_chunk_count = np.prod(
-            count_chunks_to_cover(self._shape, spectra_chunking),
-        )
-
-        image_chunking = self.nx_file.root.images.data.signal.chunks
         self._images_chunk_count = np.prod(
-            count_chunks_to_cover((*self._shape[0:3], len(bins)), image_chunking),
+            count_chunks_to_cover(
+                (*self._shape[0:3], len(bins)),
+                self._images_chunking,
+            ),
         )  # this is postentially very optimistic
 
+        # The filters copy what they need out of each slab, so a single
+        # pre-allocated buffer can be reused for every read rather than
+        # allocating a fresh array per bin or pixel.
         if self._images_chunk_count < self._spectra_chunk_count:
+            signal = self._images_signal
+            image_buf = np.empty(
+                (slice_len(chunk[1]), slice_len(chunk[2])),
+                dtype=signal.dtype,
+            )
             for bb in self._tqdm(bins, desc="Images"):
+                signal.read_direct(
+                    image_buf,
+                    source_sel=np.s_[layer, chunk[1], chunk[2], bb],
+                )
                 for inner_image in totals:
-                    inner_image.add_image(
-                        bb,
-                        self.nx_file.root.images.data.signal[
-                            layer,
-                            chunk[1],
-                            chunk[2],
-                            bb,
-                        ],
-                    )
+                    inner_image.add_image(bb, image_buf)
         else:
+            signal = self._spectra_signal
+            # One read per x row instead of one per pixel; the filters are
+            # handed views into the row slab.
+            row_buf = np.empty(
+                (slice_len(chunk[2]), self._shape[3]),
+                dtype=signal.dtype,
+            )
+            row_x = None
             for x, y in self._tqdm(xy, desc="Spectra"):
-                for image in totals:
-                    image.add_spectra(
-                        x,
-                        y,
-                        self.nx_file.root.spectra.data.signal[layer, x, y, :],
+                if x != row_x:
+                    signal.read_direct(
+                        row_buf,
+                        source_sel=np.s_[layer, x, chunk[2], :],
                     )
+                    row_x = x
+                for image in totals:
+                    image.add_spectra(x, y, row_buf[y - chunk[2].start])
 
     def accumulated_spectrum(self, accumulator: Accumulator, layer: int) -> np.ndarray:
         match accumulator:
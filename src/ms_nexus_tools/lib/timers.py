@@ -39,8 +39,8 @@ class Timer(AbstractContextManager):
         self.skip_percent = skip_percent
         self.report_callback = report_callback
         assert report_callback is None or total == -1
-        self._interval = interval
-        self._timer = threading.Timer(interval=interval, function=self.report, args=[])
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
 
         self._start: float = -1
         self._last_report_time: float = -1
@@ -50,7 +50,7 @@ class Timer(AbstractContextManager):
     def __enter__(self):
         self._start = time.monotonic()
         self._last_report_time = self._start
-        self._start_timer()
+        self._thread.start()
         if self.report_callback is not None:
             _, total = self.report_callback()
         else:
@@ -64,21 +64,24 @@ class Timer(AbstractContextManager):
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
-        self._timer.cancel()
+        self._stop.set()
+        self._thread.join()
         now = time.monotonic()
         print(f"{self.name} completed in {now - self._start:.2f}s")
 
     def total_time(self) -> float:
         return time.monotonic() - self._start
 
-    def _start_timer(self) -> None:
-        self._timer.cancel()
-        self._timer = threading.Timer(
-            interval=self.interval,
-            function=self._print,
-            args=[],
-        )
-        self._timer.start()
+    def _run(self) -> None:
+        # One long-lived thread instead of a fresh threading.Timer per tick.
+        # Manual reports push _last_report_time forward, so the deadline is
+        # recomputed each pass rather than rescheduled.
+        while True:
+            wait = self._last_report_time + self.interval - time.monotonic()
+            if self._stop.wait(max(wait, 0.0)):
+                return
+            if time.monotonic() - self._last_report_time >= self.interval:
+                self._print()
 
     def _print(self) -> None:
         now = time.monotonic()
@@ -97,7 +100,6 @@ class Timer(AbstractContextManager):
             print(f" {self._last_count + 1:d}/{self.total:d}: {percent:.0f}%")
             self._last_report_percent = percent
         self._last_report_time = now
-        self._start_timer()
 
     def report(self, count: int = -1) -> None:
         assert count == -1 or self.report_callback is None
@@ -150,8 +152,12 @@ class JSONTimer(AbstractContextManager):
             new_data = new_data[key]
         new_data["duration"] = duration
         new_data.update(self._data)
-        with open(self.filename, "w") as fd:
+        # Write to a sibling file and rename so a timer exiting while another
+        # reader opens the file never exposes a partially written document.
+        tmp_filename = self.filename.with_suffix(".tmp")
+        with open(tmp_filename, "w") as fd:
             json.dump(old_data, fd, indent=2)
+        tmp_filename.replace(self.filename)
 
         return False
 
@@ -6,7 +6,6 @@ from contextlib import AbstractContextManager
 
 import math
 from typing import Iterator, Any, Iterable
-from bisect import bisect_right, bisect_left
 import json
 
 import numpy as np
@@ -125,12 +124,8 @@ def count_digits(num: int) -> int:
     >>> count_digits(0)
     1
     """
-    digits = 1
-    num = abs(num) // 10
-    while num > 0:
-        digits += 1
-        num = num // 10
-    return digits
+    # str() runs in C; log10 is faster still but misrounds near powers of 10.
+    return len(str(abs(num)))
 
 
 def slice_len(slc: slice) -> int:
@@ -173,9 +168,25 @@ def slice_range(slc: slice) -> range:
     return range(slc.start, slc.stop, slc.step)
 
 
+def index_from_value(values: Number1D, value: Number, side: str = "left") -> int:
+    """
+    Binary search for value in sorted values, like bisect_left/bisect_right.
+
+    np.searchsorted does the whole search in C where bisect boxes one numpy
+    scalar per probe, but it compares in float64 rather than following the
+    scalar promotion rules bisect's element-wise comparisons use.  Casting
+    the probe with result_type restores those rules, so this returns exactly
+    what bisect would.
+    """
+    values = np.asarray(values)
+    probe = np.result_type(values, value).type(value)
+    return int(np.searchsorted(values, probe, side=side))
+
+
 def slice_from_values(start: Number, stop: Number, values: Number1D) -> slice:
-    start_index = bisect_left(values, start)
-    stop_index = bisect_right(values, stop)
+    values = np.asarray(values)
+    start_index = index_from_value(values, start, side="left")
+    stop_index = index_from_value(values, stop, side="right")
     return slice(start_index, stop_index)
 
 
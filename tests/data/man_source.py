@@ -18,8 +18,6 @@ from ms_nexus_tools.lib.data_source import (
     UnknownAxisError,
 )
 
-from icecream import ic
-
 
 class ManData:
     def __init__(self):
@@ -235,8 +233,6 @@ class ManSource(AbstractDataSource):
         if self.any_sparse:
             mask = np.full((self.man_data.total_int.shape[0],), True)
 
-            ic(memory_chunk)
-
             pos = np.array(
                 [
                     (
@@ -2,8 +2,12 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 from pathlib import Path
+import bisect
 import re
 
+from hypothesis import given, strategies as st
+
+import numpy as np
 import pytest
 
 from ms_nexus_tools import lib as mnxlib
@@ -25,6 +29,18 @@ def test_count_digits():
     assert mnxlib.utils.count_digits(-11111) == 5
 
 
+@given(st.integers())
+def test_count_digits_matches_division(num):
+    # Repeated division by ten is an oracle independent of the str()-based
+    # implementation, so the property still bites if that is ever replaced.
+    expected = 1
+    remaining = abs(num)
+    while remaining >= 10:
+        remaining //= 10
+        expected += 1
+    assert mnxlib.utils.count_digits(num) == expected
+
+
 def test_file_guard_delete():
 
     filename = Path(__file__).parent / "test.txt"
@@ -142,3 +158,19 @@ def test_file_guard_check():
     assert filename.exists()
     assert not filename2.exists()
     filename.unlink()
+
+
+def test_index_from_value():
+    for dtype in (np.float64, np.float32, np.int16):
+        values = (np.arange(10) * (1 if dtype == np.int16 else 0.1)).astype(dtype)
+        for value in (0.0, 0.1, 0.35, 0.7, 3, 3.5, 100.0):
+            assert mnxlib.utils.index_from_value(values, value) == bisect.bisect_left(
+                values, value
+            )
+            assert mnxlib.utils.index_from_value(
+                values, value, side="right"
+            ) == bisect.bisect_right(values, value)
+
+    assert mnxlib.utils.slice_from_values(
+        0.1, 0.7, (np.arange(10) * 0.1).astype(np.float32)
+    ) == slice(1, 8)